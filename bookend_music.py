@@ -6,15 +6,35 @@ append an "end" music clip to each file, writing the combined result to an outpu
 folder.  It is useful when you want consistent bookend music around already-split
 verses or other short clips.
 
-Requires: Python 3.9+, pydub, and ffmpeg installed & on PATH.
+When the bookends and a source file share codec, sample rate, channel count and
+bitrate the three files are joined with ffmpeg's concat demuxer without
+re-encoding; otherwise they are decoded and encoded once with the concat filter.
+
+Requires: Python 3.9+, and ffmpeg/ffprobe installed & on PATH.
 """
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_BITRATE = "192k"
+
 
-from pydub import AudioSegment
+@dataclass(frozen=True)
+class Bookend:
+    """A begin/end clip: the original file, its decoded PCM copy, and its stream info."""
+
+    path: Path
+    pcm_path: Path
+    info: Dict[str, str]
 
 
 def normalize_extensions(exts: Iterable[str]) -> List[str]:
@@ -29,11 +49,150 @@ def normalize_extensions(exts: Iterable[str]) -> List[str]:
     return normalized
 
 
-def export_with_bitrate(segment: AudioSegment, destination: Path, bitrate: str | None) -> None:
-    export_kwargs = {}
-    if destination.suffix.lower() == '.mp3' and bitrate:
-        export_kwargs['bitrate'] = bitrate
-    segment.export(destination, format=destination.suffix.lstrip('.'), **export_kwargs)
+def parse_bitrate(bitrate: str) -> int:
+    """Parse an ffmpeg style bitrate such as ``192k`` into bits per second."""
+
+    text = bitrate.strip().lower()
+    if text.endswith('k'):
+        return int(float(text[:-1]) * 1000)
+    if text.endswith('m'):
+        return int(float(text[:-1]) * 1_000_000)
+    return int(float(text))
+
+
+def run_ffmpeg(args: List[str]) -> None:
+    """Run ffmpeg quietly, turning failures into a readable ``SystemExit``."""
+
+    result = subprocess.run(
+        ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", "-y", *args],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"ffmpeg failed ({result.returncode}): {result.stderr.strip()}")
+
+
+def probe_audio(path: Path) -> Dict[str, str]:
+    """Return codec/sample rate/channels/bitrate of the first audio stream in ``path``."""
+
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-select_streams", "a:0",
+            "-show_entries", "stream=codec_name,sample_rate,channels,bit_rate",
+            "-of", "json",
+            str(path),
+        ],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"ffprobe failed for {path}: {result.stderr.strip()}")
+    streams = json.loads(result.stdout or "{}").get("streams") or []
+    if not streams:
+        raise SystemExit(f"No audio stream found in {path}")
+    return {key: str(value) for key, value in streams[0].items()}
+
+
+def decode_to_wav(source: Path, destination: Path) -> None:
+    """Decode ``source`` once to 16-bit PCM WAV so it can be reused for every file."""
+
+    run_ffmpeg(["-i", str(source), "-map", "0:a", "-f", "wav", "-acodec", "pcm_s16le", str(destination)])
+
+
+def can_stream_copy(infos: Iterable[Dict[str, str]], destination: Path, bitrate: Optional[str]) -> bool:
+    """True when the inputs can be concatenated without decoding.
+
+    All streams must share codec, sample rate and channel count, the destination
+    container must match the source (e.g. mp3 into ``.mp3``), and when an
+    explicit ``bitrate`` is requested every input must already be at it.
+    """
+
+    infos = list(infos)
+    first = infos[0]
+    for key in ("codec_name", "sample_rate", "channels"):
+        if any(info.get(key) != first.get(key) for info in infos):
+            return False
+    if destination.suffix.lower() == '.mp3' and first.get("codec_name") != "mp3":
+        return False
+    if bitrate is not None:
+        wanted = parse_bitrate(bitrate)
+        if any(info.get("bit_rate") != str(wanted) for info in infos):
+            return False
+    return True
+
+
+def concat_list_entry(path: Path) -> str:
+    escaped = str(path).replace("'", "'\\''")
+    return f"file '{escaped}'\n"
+
+
+def concat_audio(
+    begin: Path,
+    source: Path,
+    end: Path,
+    destination: Path,
+    bitrate: Optional[str],
+    *,
+    stream_copy: bool,
+) -> None:
+    """Write ``begin + source + end`` to ``destination`` with a single ffmpeg call.
+
+    With ``stream_copy`` the concat demuxer joins the packets as-is; otherwise the
+    concat filter decodes all three inputs and the result is encoded once (as mp3
+    at ``bitrate`` when the destination is an ``.mp3``). Pass the cached PCM WAVs
+    as ``begin``/``end`` in that case so only ``source`` needs decoding.
+    """
+
+    if stream_copy:
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".txt", delete=False, encoding="utf-8"
+        ) as list_file:
+            for path in (begin, source, end):
+                list_file.write(concat_list_entry(path))
+        try:
+            run_ffmpeg(
+                ["-f", "concat", "-safe", "0", "-i", list_file.name, "-map", "0:a", "-c", "copy", str(destination)]
+            )
+        finally:
+            os.unlink(list_file.name)
+        return
+
+    codec_args: List[str] = []
+    if destination.suffix.lower() == '.mp3':
+        codec_args = ["-c:a", "libmp3lame", "-b:a", bitrate or DEFAULT_BITRATE]
+    run_ffmpeg(
+        [
+            "-i", str(begin),
+            "-i", str(source),
+            "-i", str(end),
+            "-filter_complex", "[0:a][1:a][2:a]concat=n=3:v=0:a=1[out]",
+            "-map", "[out]",
+            *codec_args,
+            str(destination),
+        ]
+    )
+
+
+def _bookend_one(
+    source_path: Path,
+    destination_path: Path,
+    begin: Bookend,
+    end: Bookend,
+    bitrate: Optional[str],
+) -> Path:
+    """Worker entry point: bookend a single file. Runs in a child process."""
+
+    stream_copy = can_stream_copy((begin.info, probe_audio(source_path), end.info), destination_path, bitrate)
+    if stream_copy:
+        begin_path, end_path = begin.path, end.path
+    else:
+        begin_path, end_path = begin.pcm_path, end.pcm_path
+    concat_audio(begin_path, source_path, end_path, destination_path, bitrate, stream_copy=stream_copy)
+    return destination_path
 
 
 def main() -> None:
@@ -71,16 +230,27 @@ def main() -> None:
     )
     parser.add_argument(
         "--bitrate",
-        default="192k",
-        help="Bitrate to use when exporting mp3 files (default: 192k)",
+        help=(
+            f"Bitrate to use when re-encoding mp3 files (default: {DEFAULT_BITRATE}). "
+            "When given, inputs at a different bitrate are re-encoded instead of stream-copied."
+        ),
     )
     parser.add_argument(
         "--skip_existing",
         action="store_true",
         help="Skip files whose destination already exists.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of files to process in parallel (default: number of CPUs)",
+    )
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+
     input_dir = Path(args.input_dir).expanduser().resolve()
     if not input_dir.is_dir():
         raise SystemExit(f"Input directory not found or not a directory: {input_dir}")
@@ -95,29 +265,52 @@ def main() -> None:
     if not end_music_path.is_file():
         raise SystemExit(f"End music file not found: {end_music_path}")
 
-    begin_segment = AudioSegment.from_file(begin_music_path)
-    end_segment = AudioSegment.from_file(end_music_path)
+    for tool in ("ffmpeg", "ffprobe"):
+        if shutil.which(tool) is None:
+            raise SystemExit(f"{tool} not found on PATH. Install ffmpeg and try again.")
 
     extensions = normalize_extensions(args.extensions)
     if not extensions:
         raise SystemExit("No valid extensions provided.")
 
-    audio_files = [p for p in sorted(input_dir.iterdir()) if p.is_file() and p.suffix.lower() in extensions]
+    # DirEntry.is_file() reuses the type from the directory listing, so this is
+    # one syscall per entry rather than iterdir() + stat().
+    with os.scandir(input_dir) as it:
+        audio_files = [
+            Path(entry.path)
+            for entry in it
+            if os.path.splitext(entry.name)[1].lower() in extensions and entry.is_file()
+        ]
+    audio_files.sort()
     if not audio_files:
         raise SystemExit(
             "No audio files found in input directory matching extensions: " + ", ".join(extensions)
         )
 
+    jobs = []
     for source_path in audio_files:
         destination_name = f"{args.prefix}{source_path.name}"
         destination_path = output_dir / destination_name
         if args.skip_existing and destination_path.exists():
             continue
+        jobs.append((source_path, destination_path))
+
+    if jobs:
+        with tempfile.TemporaryDirectory(prefix="bookend_") as scratch_dir:
+            scratch = Path(scratch_dir)
+            decode_to_wav(begin_music_path, scratch / "begin.wav")
+            decode_to_wav(end_music_path, scratch / "end.wav")
+            begin = Bookend(begin_music_path, scratch / "begin.wav", probe_audio(begin_music_path))
+            end = Bookend(end_music_path, scratch / "end.wav", probe_audio(end_music_path))
 
-        source_segment = AudioSegment.from_file(source_path)
-        combined = begin_segment + source_segment + end_segment
-        export_with_bitrate(combined, destination_path, args.bitrate)
-        print(f"Wrote {destination_path}")
+            max_workers = min(args.jobs, len(jobs))
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(_bookend_one, source_path, destination_path, begin, end, args.bitrate)
+                    for source_path, destination_path in jobs
+                ]
+                for future in concurrent.futures.as_completed(futures):
+                    print(f"Wrote {future.result()}")
 
     print(f"Done. Processed {len(audio_files)} file(s). Output directory: {output_dir}")
 
@@ -10,21 +10,44 @@ Features:
   - Optional ZIP of outputs.
   - Alternative mode: provide a timestamps CSV to define exact cuts.
 
-Requires: Python 3.9+, pydub, and ffmpeg installed & on PATH.
+Each verse is cut and encoded by its own ffmpeg process (seeking straight to the
+cut), so the source is never decoded into memory as a whole.
+
+Requires: Python 3.9+, and ffmpeg/ffprobe installed & on PATH.
 """
 import argparse
+import contextlib
 import csv
+import functools
+import importlib.util
 import os
+import re
+import shutil
+import subprocess
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from typing import List, Tuple
 from dataclasses import dataclass
 from datetime import datetime, time, timedelta
-from typing import Dict, Iterator, List, Optional, Tuple
-from pydub import AudioSegment
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 try:
-    from openpyxl import load_workbook
-except ImportError:  # pragma: no cover - optional dependency
-    load_workbook = None
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+if TYPE_CHECKING:  # annotations only
+    import numpy as np
+    import pyarrow as pa
+
+# openpyxl, pyarrow, numpy and zipfile are imported where they are used,
+# so `--help` and plain grid runs do not pay for loading them.
+
+
+def has_module(name: str) -> bool:
+    """True when ``name`` can be imported, without importing it."""
+    return importlib.util.find_spec(name) is not None
 
 
 @dataclass
@@ -36,65 +59,110 @@ class Segment:
     @property
     def duration_ms(self) -> int:
         return max(0, self.end_ms - self.start_ms)
-import zipfile
+
+
+@dataclass(frozen=True)
+class PcmSource:
+    """An input decoded once to raw interleaved s16le PCM on disk (see --decode-once).
+
+    Only the span the cuts need is decoded; ``start_ms`` is where the file begins.
+    """
+    path: str
+    sample_rate: int
+    channels: int
+    start_ms: int = 0
+
+    def frame(self, ms: int) -> int:
+        return ms * self.sample_rate // 1000 - self.start_ms * self.sample_rate // 1000
+
+def _hms_to_ms(h: int, m: int, s: float) -> int:
+    return int(round((h * 3600 + m * 60 + s) * 1000))
+
 
 def parse_time(s: str) -> int:
     """
     Parse time like "75" (seconds), "01:15", or "01:15.250" into milliseconds.
     """
-    s = s.strip()
-    if ':' not in s:
-        # seconds (possibly float)
-        sec = float(s)
-        return int(round(sec * 1000))
+    return _parse_time_text(s.strip())
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_time_text(s: str) -> int:
+    """:func:`parse_time` on an already stripped string (cached: timestamp files repeat values)."""
+    # one split, dispatched on the number of fields (a compiled regex measured slower)
     parts = s.split(':')
-    if len(parts) == 2:
+    n_parts = len(parts)
+    if n_parts == 1:
+        # seconds (possibly float)
+        return _hms_to_ms(0, 0, float(s))
+    if n_parts == 2:
         mm, ss = parts
-        return int(round((int(mm) * 60 + float(ss)) * 1000))
-    elif len(parts) == 3:
+        return _hms_to_ms(0, int(mm), float(ss))
+    if n_parts == 3:
         hh, mm, ss = parts
-        total_sec = int(hh) * 3600 + int(mm) * 60 + float(ss)
-        return int(round(total_sec * 1000))
-    else:
-        raise ValueError(f"Unrecognized time format: {s}")
+        return _hms_to_ms(int(hh), int(mm), float(ss))
+    raise ValueError(f"Unrecognized time format: {s}")
 
 def mmss(ms: int) -> str:
-    s = int(round(ms/1000))
-    m = s // 60
-    sec = s % 60
-    return f"{m:02d}:{sec:02d}"
+    # integer-only round-half-even to whole seconds, same result as round(ms/1000)
+    s, rem = divmod(ms, 1000)
+    if rem > 500 or (rem == 500 and s & 1):
+        s += 1
+    return f"{s // 60:02d}:{s % 60:02d}"
+
+
+# ASCII fast path for sanitize_filename: keep alnum and "_-.", whitespace -> "_", drop the rest
+_SAFE_FILENAME_TABLE = {
+    code: (chr(code) if chr(code).isalnum() or chr(code) in "_-." else "_" if chr(code).isspace() else None)
+    for code in range(128)
+}
 
 
 def sanitize_filename(name: str, fallback: str) -> str:
     base = name.strip() if name else ""
-    allowed = []
-    for ch in base:
-        if ch.isalnum() or ch in ("_", "-", "."):
-            allowed.append(ch)
-        elif ch.isspace():
-            allowed.append("_")
-    cleaned = "".join(allowed).strip("._")
+    if base.isascii():
+        cleaned = base.translate(_SAFE_FILENAME_TABLE)
+    else:
+        allowed = []
+        for ch in base:
+            if ch.isalnum() or ch in ("_", "-", "."):
+                allowed.append(ch)
+            elif ch.isspace():
+                allowed.append("_")
+        cleaned = "".join(allowed)
+    cleaned = cleaned.strip("._")
     return cleaned or fallback
 
 
+# [\W_] matches exactly the characters str.isalnum() rejects.
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+
 def normalize_header(cell: str) -> str:
-    return "".join(ch for ch in cell.lower() if ch.isalnum())
+    return _NON_ALNUM_RE.sub("", cell.lower())
+
 
 def grid_cuts(start_ms: int, count: int, length_ms: int, total_ms: int) -> List[Tuple[int, int]]:
-    cuts = []
-    for i in range(count):
-        st = start_ms + i * length_ms
-        en = st + length_ms
-        st = max(0, min(st, total_ms))
-        en = max(0, min(en, total_ms))
-        if en <= st:
-            break
-        cuts.append((st, en))
+    if count <= 0 or length_ms <= 0:
+        return []
+    # Whole verses that fit before the end, then at most one truncated verse.
+    n_full = min(count, max(0, total_ms - start_ms) // length_ms)
+    # zipping two ranges builds the tuples in C: ~2x a list comprehension, and faster than numpy
+    end_ms = start_ms + n_full * length_ms
+    cuts = list(zip(range(start_ms, end_ms, length_ms), range(start_ms + length_ms, end_ms + length_ms, length_ms)))
+    if n_full < count and end_ms < total_ms:
+        cuts.append((end_ms, total_ms))
+    # A negative start only clips the first verse (or drops the grid if it ends before 0).
+    if cuts and cuts[0][0] < 0:
+        if cuts[0][1] <= 0:
+            return []
+        cuts[0] = (0, cuts[0][1])
     return cuts
 
 
-def parse_excel_time(value) -> int:
-    """Parse the Excel "Beginning"/"Ending" cell into milliseconds."""
+@functools.lru_cache(maxsize=8192)
+def _parse_excel_text(text: str) -> int:
+    """Parse a textual Excel time cell into milliseconds (cached: workbooks repeat values)."""
 
     def minutes_seconds_from_string(text: str) -> Tuple[int, int]:
         text = text.strip()
@@ -119,6 +187,16 @@ def parse_excel_time(value) -> int:
         total_seconds = int(round(minutes_float * 60))
         return total_seconds, 0
 
+    seconds_or_ms, remainder = minutes_seconds_from_string(text)
+    if remainder == 0:
+        total_seconds = seconds_or_ms
+    else:
+        total_seconds = seconds_or_ms + remainder / 1000.0
+    return int(round(total_seconds * 1000))
+
+
+def parse_excel_time(value) -> int:
+    """Parse the Excel "Beginning"/"Ending" cell into milliseconds."""
     if value is None:
         raise ValueError("Missing time value in Excel sheet")
 
@@ -138,12 +216,7 @@ def parse_excel_time(value) -> int:
     if not text_value:
         raise ValueError("Empty time value in Excel sheet")
 
-    seconds_or_ms, remainder = minutes_seconds_from_string(text_value)
-    if remainder == 0:
-        total_seconds = seconds_or_ms
-    else:
-        total_seconds = seconds_or_ms + remainder / 1000.0
-    return int(round(total_seconds * 1000))
+    return _parse_excel_text(text_value)
 
 
 def clamp_segment(start_ms: int, end_ms: int, total_ms: int) -> Tuple[int, int]:
@@ -153,7 +226,9 @@ def clamp_segment(start_ms: int, end_ms: int, total_ms: int) -> Tuple[int, int]:
 
 
 def load_timestamps_excel(path: str) -> Dict[str, List[Segment]]:
-    if load_workbook is None:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:  # pragma: no cover - optional dependency
         raise SystemExit(
             "openpyxl is required to read Excel timestamp files. Install it with `pip install openpyxl`."
         )
@@ -281,6 +356,87 @@ def next_from_iterator(it: Iterator[str]) -> Optional[str]:
         return next(it)
     except StopIteration:
         return None
+def parse_time_array(values: "pa.Array") -> "pa.Array":
+    """Vectorized :func:`parse_time` over an Arrow string array (int64 ms).
+
+    Raises ``pa.ArrowInvalid``/``ValueError`` for anything the fast path does not
+    handle so the caller can fall back to the scalar parser.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    values = pc.utf8_trim_whitespace(values)
+    parts = pc.split_pattern(values, ":")
+    counts = pc.list_value_length(parts)
+    if pc.any(pc.or_(pc.less(counts, 1), pc.greater(counts, 3))).as_py():
+        raise ValueError("Unrecognized time format")
+
+    result = pa.array([0.0] * len(values), type=pa.float64())
+    for n_parts in (1, 2, 3):
+        mask = pc.equal(counts, n_parts)
+        if not pc.any(mask).as_py():
+            continue
+        group = pc.filter(parts, mask)
+        seconds = pc.cast(pc.list_element(group, n_parts - 1), pa.float64())
+        whole = pa.array([0] * len(group), type=pa.int64())
+        for position in range(n_parts - 1):
+            unit = 3600 if n_parts - 1 - position == 2 else 60
+            field = pc.cast(pc.list_element(group, position), pa.int64())
+            whole = pc.add(whole, pc.multiply(field, unit))
+        total_sec = pc.add(pc.cast(whole, pa.float64()), seconds)
+        result = pc.replace_with_mask(result, mask, pc.multiply(total_sec, 1000.0))
+    return pc.cast(pc.round(result, round_mode="half_to_even"), pa.int64())
+
+
+def load_timestamps_csv_arrow(
+    path: str, n_columns: int, idx_start: int, idx_second: int, use_end: bool, total_ms: int
+) -> Optional[List[Tuple[int, int]]]:
+    """pyarrow fast path for :func:`load_timestamps_csv` on a CSV with a header row.
+
+    Returns None when the file needs the row-by-row parser instead (ragged rows,
+    missing values, unusual time formats).
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+
+    names = [f"c{i}" for i in range(n_columns)]
+    wanted = [names[idx_start], names[idx_second]]
+    try:
+        table = pacsv.read_csv(
+            path,
+            read_options=pacsv.ReadOptions(skip_rows=1, column_names=names),
+            convert_options=pacsv.ConvertOptions(
+                column_types={name: pa.string() for name in wanted},
+                include_columns=wanted,
+            ),
+        )
+    except pa.ArrowInvalid:
+        return None
+
+    start_col = table.column(wanted[0]).combine_chunks()
+    second_col = table.column(wanted[1]).combine_chunks()
+    for col in (start_col, second_col):
+        if col.null_count or pc.any(pc.equal(pc.utf8_trim_whitespace(col), "")).as_py():
+            return None
+    try:
+        st = parse_time_array(start_col)
+        second = parse_time_array(second_col)
+    except (pa.ArrowInvalid, ValueError):
+        return None
+    en = second if use_end else pc.add(st, second)
+
+    # clamp
+    st = pc.max_element_wise(0, pc.min_element_wise(st, total_ms))
+    en = pc.max_element_wise(0, pc.min_element_wise(en, total_ms))
+    keep = pc.greater(en, st)
+    return list(zip(pc.filter(st, keep).to_pylist(), pc.filter(en, keep).to_pylist()))
+
+
+# Header keywords per column role, matched as prefixes of normalize_header() output.
+_HEADER_RE = re.compile(r"(?P<start>start|begin)|(?P<end>end|stop|finish)|(?P<dur>duration|length|dur)")
+
+
 def load_timestamps_csv(path: str, total_ms: int) -> List[Tuple[int,int]]:
     """
     CSV with either headers or not. Expect either:
@@ -291,69 +447,491 @@ def load_timestamps_csv(path: str, total_ms: int) -> List[Tuple[int,int]]:
     """
     cuts = []
     with open(path, newline='', encoding='utf-8-sig') as f:
-        reader = csv.reader(f)
-        rows = list(reader)
+        header_raw = [c.strip() for c in next(csv.reader(f), [])]
     # try to detect header
-    def find_column(header_norm: List[str], keywords: Tuple[str, ...]) -> Optional[int]:
-        for idx, norm in enumerate(header_norm):
-            for kw in keywords:
-                if norm == kw or norm.startswith(kw):
-                    return idx
-        return None
-
-    header_raw = [c.strip() for c in rows[0]] if rows else []
-    header_norm = [normalize_header(c) for c in header_raw]
-    idx_start: Optional[int] = None
-    idx_end: Optional[int] = None
-    idx_dur: Optional[int] = None
-
     def row_looks_like_header(row: List[str]) -> bool:
         return any(any(ch.isalpha() for ch in cell) for cell in row)
 
+    columns: Dict[str, int] = {}
     start_row = 0
     if header_raw and row_looks_like_header(header_raw):
         start_row = 1
-        idx_start = find_column(header_norm, ("start", "begin"))
-        idx_end = find_column(header_norm, ("end", "stop", "finish"))
-        idx_dur = find_column(header_norm, ("duration", "length", "dur"))
+        for idx, cell in enumerate(header_raw):
+            match = _HEADER_RE.match(normalize_header(cell))
+            if match is not None:
+                columns.setdefault(match.lastgroup, idx)
+    idx_start = columns.get("start")
+    idx_end = columns.get("end")
+    idx_dur = columns.get("dur")
+
+    if start_row == 1 and idx_start is not None and has_module("pyarrow"):
+        idx_second = idx_end if idx_end is not None else idx_dur
+        if idx_second is not None:
+            fast = load_timestamps_csv_arrow(
+                path, len(header_raw), idx_start, idx_second, idx_end is not None, total_ms
+            )
+            if fast is not None:
+                return fast
 
-    for r in rows[start_row:]:
-        row = [cell.strip() for cell in r]
-        if not row or all(not cell for cell in row):
-            continue
-        use_end = False
-        start_s: Optional[str] = None
-        second: Optional[str] = None
-
-        if idx_start is not None and idx_start < len(row) and row[idx_start]:
-            start_s = row[idx_start]
-            if idx_end is not None and idx_end < len(row) and row[idx_end]:
-                second = row[idx_end]
-                use_end = True
-            elif idx_dur is not None and idx_dur < len(row) and row[idx_dur]:
-                second = row[idx_dur]
-        if start_s is None or second is None:
-            # fall back to the first two populated columns (legacy behaviour)
-            populated = [cell for cell in row if cell]
-            if len(populated) < 2:
-                raise ValueError("Timestamps CSV needs at least 2 columns (start,end or start,duration).")
-            start_s, second = populated[0], populated[1]
+    # stream the data rows; only the current one is held in memory
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        if start_row:
+            next(reader, None)
+        for r in reader:
+            row = [cell.strip() for cell in r]
+            if not row or all(not cell for cell in row):
+                continue
             use_end = False
-
-        st = parse_time(start_s)
-        if use_end:
-            en = parse_time(second)
-        else:
-            dur = parse_time(second)
-            en = st + dur
-
-        # clamp
-        st = max(0, min(st, total_ms))
-        en = max(0, min(en, total_ms))
-        if en > st:
-            cuts.append((st, en))
+            start_s: Optional[str] = None
+            second: Optional[str] = None
+
+            if idx_start is not None and idx_start < len(row) and row[idx_start]:
+                start_s = row[idx_start]
+                if idx_end is not None and idx_end < len(row) and row[idx_end]:
+                    second = row[idx_end]
+                    use_end = True
+                elif idx_dur is not None and idx_dur < len(row) and row[idx_dur]:
+                    second = row[idx_dur]
+            if start_s is None or second is None:
+                # fall back to the first two populated columns (legacy behaviour)
+                populated = [cell for cell in row if cell]
+                if len(populated) < 2:
+                    raise ValueError("Timestamps CSV needs at least 2 columns (start,end or start,duration).")
+                start_s, second = populated[0], populated[1]
+                use_end = False
+
+            st = parse_time(start_s)
+            if use_end:
+                en = parse_time(second)
+            else:
+                dur = parse_time(second)
+                en = st + dur
+
+            # clamp
+            st = max(0, min(st, total_ms))
+            en = max(0, min(en, total_ms))
+            if en > st:
+                cuts.append((st, en))
     return cuts
 
+# Output bitrate when --bitrate is not given (and cuts cannot be stream-copied).
+DEFAULT_BITRATE = "192k"
+
+# Upper bound on outputs per ffmpeg process in --single-pass mode (each one is an open file).
+SINGLE_PASS_MAX_OUTPUTS = 64
+
+# How far before a cut the coarse (demuxer) seek lands; the rest is decoded accurately.
+SEEK_PREROLL_MS = 2000
+
+# Buffer size for PCM piped into ffmpeg (Python writer and, on Linux, the pipe itself).
+PCM_PIPE_BUFSIZE = 1 << 20
+
+# Write buffers for the ZIP and CSV outputs (zipfile copies members in 8 KiB chunks).
+ZIP_WRITE_BUFSIZE = 1 << 20
+CSV_WRITE_BUFSIZE = 1 << 16
+
+
+def grow_pipe(pipe) -> None:
+    """Best-effort: raise a pipe's kernel buffer to PCM_PIPE_BUFSIZE (Linux only)."""
+    set_size = getattr(fcntl, "F_SETPIPE_SZ", None) if fcntl is not None else None
+    if set_size is None:
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), set_size, PCM_PIPE_BUFSIZE)
+    except OSError:
+        pass
+
+
+def run_ffmpeg(args: List[str], input_blocks: Optional[Iterable] = None) -> None:
+    """Run ffmpeg quietly; raise SystemExit with its error output on failure.
+
+    ``input_blocks`` (bytes-like objects, e.g. numpy arrays) are written in turn
+    to ffmpeg's stdin for ``-i pipe:0``; otherwise stdin is /dev/null.
+    """
+    cmd = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", "-y", *args]
+    if input_blocks is None:
+        result = subprocess.run(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        returncode, stderr = result.returncode, result.stderr
+    else:
+        # subprocess.run(input=...) writes in PIPE_BUF (4 KiB) chunks; a buffered
+        # writer on a grown pipe moves PCM in far fewer, larger writes.
+        with tempfile.TemporaryFile() as err:
+            proc = subprocess.Popen(
+                cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=err, bufsize=PCM_PIPE_BUFSIZE
+            )
+            grow_pipe(proc.stdin)
+            try:
+                for block in input_blocks:
+                    proc.stdin.write(memoryview(block).cast("B"))
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass  # ffmpeg exited early; its exit code and stderr explain why
+            returncode = proc.wait()
+            err.seek(0)
+            stderr = err.read()
+    if returncode != 0:
+        message = stderr.decode("utf-8", "replace").strip()
+        raise SystemExit(f"ffmpeg failed ({returncode}): {message}")
+
+
+def probe_duration_ms(path: str) -> int:
+    """Return the duration of ``path`` in milliseconds using ffprobe (no decoding)."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", path],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"ffprobe failed for {path}: {result.stderr.strip()}")
+    try:
+        return int(round(float(result.stdout.strip()) * 1000))
+    except ValueError:
+        raise SystemExit(f"Could not determine duration of {path}") from None
+
+
+@functools.lru_cache(maxsize=None)
+def probe_audio_codec(path: str) -> Tuple[str, str]:
+    """Return ``(codec_name, bit_rate)`` of the first audio stream in ``path`` (cached per path)."""
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "error", "-select_streams", "a:0",
+            "-show_entries", "stream=codec_name,bit_rate", "-of", "csv=p=0", path,
+        ],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"ffprobe failed for {path}: {result.stderr.strip()}")
+    fields = result.stdout.strip().split(",")
+    if not fields[0]:
+        raise SystemExit(f"No audio stream found in {path}")
+    return fields[0], fields[1] if len(fields) > 1 else ""
+
+
+def parse_bitrate(bitrate: str) -> int:
+    """Parse an ffmpeg style bitrate such as ``192k`` into bits per second."""
+    text = bitrate.strip().lower()
+    if text.endswith('k'):
+        return int(float(text[:-1]) * 1000)
+    if text.endswith('m'):
+        return int(float(text[:-1]) * 1_000_000)
+    return int(float(text))
+
+
+def probe_audio_format(path: str) -> Tuple[int, int]:
+    """Return ``(sample_rate, channels)`` of the first audio stream in ``path``."""
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "error", "-select_streams", "a:0",
+            "-show_entries", "stream=sample_rate,channels", "-of", "csv=p=0", path,
+        ],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"ffprobe failed for {path}: {result.stderr.strip()}")
+    try:
+        sample_rate, channels = result.stdout.strip().split(",")[:2]
+        return int(sample_rate), int(channels)
+    except ValueError:
+        raise SystemExit(f"No audio stream found in {path}") from None
+
+
+def decode_to_pcm(input_path: str, scratch_dir: str, start_ms: int = 0, end_ms: Optional[int] = None) -> PcmSource:
+    """Decode ``[start_ms, end_ms)`` of ``input_path`` once to a raw s16le file in ``scratch_dir``."""
+    sample_rate, channels = probe_audio_format(input_path)
+    fd, pcm_path = tempfile.mkstemp(suffix=".pcm", dir=scratch_dir)
+    os.close(fd)
+    ffmpeg_args = []
+    if start_ms > 0:
+        ffmpeg_args += ["-ss", f"{start_ms / 1000:.3f}"]
+    if end_ms is not None:
+        ffmpeg_args += ["-t", f"{(end_ms - start_ms) / 1000:.3f}"]
+    ffmpeg_args += ["-i", input_path, "-map", "0:a", "-f", "s16le", "-acodec", "pcm_s16le", pcm_path]
+    run_ffmpeg(ffmpeg_args)
+    return PcmSource(pcm_path, sample_rate, channels, start_ms)
+
+
+def fade_filter(fade_in: int, fade_out: int, duration_ms: int, offset_ms: int = 0) -> Optional[str]:
+    """Build the ``-af`` afade chain for a cut, or None when no fades are needed.
+
+    Filters run before an output-side ``-ss`` trims the stream, so when the cut
+    starts ``offset_ms`` into the decoded audio the fades are shifted by that much.
+    """
+    filters = []
+    if fade_in > 0:
+        filters.append(f"afade=t=in:st={offset_ms / 1000:.3f}:d={fade_in / 1000:.3f}")
+    if fade_out > 0:
+        fade_start = offset_ms + max(0, duration_ms - fade_out)
+        filters.append(f"afade=t=out:st={fade_start / 1000:.3f}:d={fade_out / 1000:.3f}")
+    return ",".join(filters) or None
+
+
+def can_stream_copy(input_path: str, fade_in: int, fade_out: int, bitrate: Optional[str] = None) -> bool:
+    """Cuts can skip re-encoding when there are no fades and the source is already mp3.
+
+    With an explicit ``bitrate`` the source must also already be at that bitrate.
+    """
+    if fade_in > 0 or fade_out > 0:
+        return False
+    codec_name, bit_rate = probe_audio_codec(input_path)
+    if codec_name != "mp3":
+        return False
+    return bitrate is None or bit_rate == str(parse_bitrate(bitrate))
+
+
+def export_cut(
+    input_path: str,
+    st: int,
+    en: int,
+    fpath: str,
+    fade_in: int,
+    fade_out: int,
+    bitrate: str,
+    stream_copy: bool = False,
+    vbr_quality: Optional[int] = None,
+) -> str:
+    """Cut ``[st, en)`` ms out of ``input_path`` with fades and encode it to ``fpath`` as mp3.
+
+    Seeking is two-stage: a coarse ``-ss`` before ``-i`` jumps (in the demuxer)
+    to SEEK_PREROLL_MS ahead of the cut, then an ``-ss`` after ``-i`` decodes
+    only that short pre-roll, which also primes the decoder for an accurate
+    start. Late cuts in a long file cost the same as early ones. With
+    ``stream_copy`` the mp3 frames are copied as-is (no decode, no fades,
+    source bitrate kept). Runs in a worker process.
+    """
+    if stream_copy:
+        ffmpeg_args = ["-ss", f"{st / 1000:.3f}", "-t", f"{(en - st) / 1000:.3f}", "-i", input_path]
+        preroll_ms = 0
+    else:
+        coarse_ms = max(0, st - SEEK_PREROLL_MS)
+        preroll_ms = st - coarse_ms
+        ffmpeg_args = [
+            "-ss", f"{coarse_ms / 1000:.3f}",
+            "-i", input_path,
+            "-ss", f"{preroll_ms / 1000:.3f}",
+            "-t", f"{(en - st) / 1000:.3f}",
+        ]
+    ffmpeg_args += [
+        "-map", "0:a",
+        *cut_codec_args(en - st, fade_in, fade_out, bitrate, stream_copy, preroll_ms, vbr_quality),
+    ]
+    run_ffmpeg(ffmpeg_args + [fpath])
+    return fpath
+
+
+def mp3_encoder_args(bitrate: str, vbr_quality: Optional[int] = None) -> List[str]:
+    """libmp3lame options: VBR at ``vbr_quality`` (0 best .. 9 smallest) when given, else CBR at ``bitrate``."""
+    if vbr_quality is not None:
+        return ["-c:a", "libmp3lame", "-q:a", str(vbr_quality)]
+    return ["-c:a", "libmp3lame", "-b:a", bitrate]
+
+
+def cut_codec_args(
+    duration_ms: int,
+    fade_in: int,
+    fade_out: int,
+    bitrate: str,
+    stream_copy: bool,
+    offset_ms: int = 0,
+    vbr_quality: Optional[int] = None,
+) -> List[str]:
+    """ffmpeg output options for one cut: stream copy, or fades + mp3 encode."""
+    if stream_copy:
+        return ["-c", "copy"]
+    codec_args: List[str] = []
+    filters = fade_filter(fade_in, fade_out, duration_ms, offset_ms)
+    if filters:
+        codec_args += ["-af", filters]
+    return codec_args + mp3_encoder_args(bitrate, vbr_quality)
+
+
+def apply_fades(block: "np.ndarray", sample_rate: int, fade_in_ms: int, fade_out_ms: int) -> "np.ndarray":
+    """Apply linear fade-in/out in place to a ``(frames, channels)`` int16 block."""
+    import numpy as np
+
+    n_in = min(len(block), max(0, fade_in_ms) * sample_rate // 1000)
+    n_out = min(len(block), max(0, fade_out_ms) * sample_rate // 1000)
+    if n_in:
+        ramp = np.linspace(0.0, 1.0, n_in, dtype=np.float32)
+        block[:n_in] = (block[:n_in].astype(np.float32) * ramp[:, None]).astype(np.int16)
+    if n_out:
+        ramp = np.linspace(1.0, 0.0, n_out, dtype=np.float32)
+        block[-n_out:] = (block[-n_out:].astype(np.float32) * ramp[:, None]).astype(np.int16)
+    return block
+
+
+def faded_cut_blocks(
+    pcm: "np.ndarray", source: PcmSource, st: int, en: int, fade_in_ms: int, fade_out_ms: int
+) -> List["np.ndarray"]:
+    """Return ``[st, en)`` of the memory-mapped ``pcm`` as blocks ready to pipe to ffmpeg.
+
+    Only the faded head and tail are copied (the mapping is read-only); the
+    untouched middle is passed on as a view of the mapping.
+    """
+    import numpy as np
+
+    block = pcm[source.frame(st):source.frame(en)]
+    n_in = min(len(block), max(0, fade_in_ms) * source.sample_rate // 1000)
+    n_out = min(len(block), max(0, fade_out_ms) * source.sample_rate // 1000)
+    if n_in + n_out > len(block):
+        # overlapping fades: apply both to one copy, in order
+        return [apply_fades(np.array(block), source.sample_rate, fade_in_ms, fade_out_ms)]
+    blocks = [
+        apply_fades(np.array(block[:n_in]), source.sample_rate, fade_in_ms, 0),
+        block[n_in:len(block) - n_out],
+        apply_fades(np.array(block[len(block) - n_out:]), source.sample_rate, 0, fade_out_ms),
+    ]
+    return [b for b in blocks if len(b)]
+
+
+# posix_fadvise hints (None where unsupported, e.g. Windows/macOS)
+FADV_WILLNEED = getattr(os, "POSIX_FADV_WILLNEED", None)
+FADV_DONTNEED = getattr(os, "POSIX_FADV_DONTNEED", None)
+
+
+def advise_pcm(source: PcmSource, st: int, en: int, advice: Optional[int]) -> None:
+    """Best-effort ``posix_fadvise`` on the bytes of ``[st, en)`` ms in the PCM file.
+
+    WILLNEED starts readahead of a cut before it is mapped in; DONTNEED drops
+    it from the page cache once it has been piped out (a no-op on tmpfs).
+    """
+    if advice is None:
+        return
+    frame_bytes = 2 * source.channels
+    first = max(0, source.frame(st))
+    length = max(0, source.frame(en) - first) * frame_bytes
+    if not length:
+        return
+    try:
+        fd = os.open(source.path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, first * frame_bytes, length, advice)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def export_cut_pcm(
+    source: PcmSource,
+    st: int,
+    en: int,
+    fpath: str,
+    fade_in: int,
+    fade_out: int,
+    bitrate: str,
+    vbr_quality: Optional[int] = None,
+) -> str:
+    """Encode ``[st, en)`` ms of a decoded :class:`PcmSource` to ``fpath`` as mp3.
+
+    The PCM file is memory-mapped, so only the pages of this cut are read;
+    fades are applied with numpy and the samples are piped straight into
+    ffmpeg. Runs in a worker process.
+    """
+    import numpy as np
+
+    advise_pcm(source, st, en, FADV_WILLNEED)
+    pcm = np.memmap(source.path, dtype=np.int16, mode="r").reshape(-1, source.channels)
+    blocks = faded_cut_blocks(pcm, source, st, en, fade_in, fade_out)
+    ffmpeg_args = [
+        "-f", "s16le", "-ar", str(source.sample_rate), "-ac", str(source.channels), "-i", "pipe:0",
+        *mp3_encoder_args(bitrate, vbr_quality),
+        fpath,
+    ]
+    run_ffmpeg(ffmpeg_args, input_blocks=blocks)
+    advise_pcm(source, st, en, FADV_DONTNEED)
+    return fpath
+
+
+def export_cuts_pcm_single_pass(
+    source: PcmSource,
+    cuts: List[Tuple[int, int, str]],
+    fade_in: int,
+    fade_out: int,
+    bitrate: str,
+    vbr_quality: Optional[int] = None,
+) -> List[str]:
+    """Encode every ``(st, en, fpath)`` cut of a :class:`PcmSource` from one ffmpeg process.
+
+    The faded cuts are streamed back to back into ffmpeg, and each cut becomes
+    its own output, trimmed with an output-side ``-ss``/``-t`` at its sample
+    offset in the stream. Every output has its own encoder, so the encoder
+    delay written to each file is its own and no audio is lost at the joins.
+    Cuts are issued in batches of SINGLE_PASS_MAX_OUTPUTS.
+    """
+    import numpy as np
+
+    pcm = np.memmap(source.path, dtype=np.int16, mode="r").reshape(-1, source.channels)
+    for offset in range(0, len(cuts), SINGLE_PASS_MAX_OUTPUTS):
+        batch = cuts[offset:offset + SINGLE_PASS_MAX_OUTPUTS]
+        cut_blocks = [faded_cut_blocks(pcm, source, st, en, fade_in, fade_out) for st, en, _ in batch]
+
+        def stream_blocks() -> Iterator["np.ndarray"]:
+            # read the next cut ahead while this one is written; drop each once it is in the pipe
+            for number, blocks in enumerate(cut_blocks):
+                if number + 1 < len(batch):
+                    advise_pcm(source, batch[number + 1][0], batch[number + 1][1], FADV_WILLNEED)
+                yield from blocks
+                advise_pcm(source, batch[number][0], batch[number][1], FADV_DONTNEED)
+
+        ffmpeg_args = ["-f", "s16le", "-ar", str(source.sample_rate), "-ac", str(source.channels), "-i", "pipe:0"]
+        frames = 0
+        for blocks, (_, _, fpath) in zip(cut_blocks, batch):
+            n_frames = sum(len(block) for block in blocks)
+            ffmpeg_args += [
+                "-map", "0:a",
+                "-ss", f"{frames / source.sample_rate:.6f}",
+                "-t", f"{n_frames / source.sample_rate:.6f}",
+                *mp3_encoder_args(bitrate, vbr_quality),
+                fpath,
+            ]
+            frames += n_frames
+        run_ffmpeg(ffmpeg_args, input_blocks=stream_blocks())
+    return [fpath for _, _, fpath in cuts]
+
+
+def export_cuts_single_pass(
+    input_path: str,
+    cuts: List[Tuple[int, int, str]],
+    fade_in: int,
+    fade_out: int,
+    bitrate: str,
+    vbr_quality: Optional[int] = None,
+) -> List[str]:
+    """Write every ``(st, en, fpath)`` cut of ``input_path`` from one ffmpeg process.
+
+    The input is opened and decoded once (seeking to the first cut) and each cut
+    becomes its own output with an output-side ``-ss``/``-t``. Cuts are issued in
+    batches of SINGLE_PASS_MAX_OUTPUTS to stay clear of open-file limits.
+    """
+    for offset in range(0, len(cuts), SINGLE_PASS_MAX_OUTPUTS):
+        batch = cuts[offset:offset + SINGLE_PASS_MAX_OUTPUTS]
+        base_ms = min(st for st, _, _ in batch)
+        ffmpeg_args = ["-ss", f"{base_ms / 1000:.3f}", "-i", input_path]
+        for st, en, fpath in batch:
+            ffmpeg_args += ["-map", "0:a", "-ss", f"{(st - base_ms) / 1000:.3f}", "-t", f"{(en - st) / 1000:.3f}"]
+            ffmpeg_args += cut_codec_args(en - st, fade_in, fade_out, bitrate, False, st - base_ms, vbr_quality)
+            ffmpeg_args.append(fpath)
+        run_ffmpeg(ffmpeg_args)
+    return [fpath for _, _, fpath in cuts]
+
+
+def open_zip(stack: contextlib.ExitStack, zip_path: str, compress: bool = False):
+    """Open ``zip_path`` for writing on ``stack``; members are added as verses finish."""
+    import zipfile
+
+    zip_file = stack.enter_context(open(zip_path, "wb", buffering=ZIP_WRITE_BUFSIZE))
+    compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+    return stack.enter_context(zipfile.ZipFile(zip_file, "w", compression, allowZip64=True))
+
+
 def main():
     ap = argparse.ArgumentParser(description="Split audio into verses by grid or timestamps.")
     ap.add_argument("-i","--input", help="Input audio file (mp3/wav/etc.)")
@@ -373,13 +951,61 @@ def main():
         help="Text file with audio sources (one path per line or 'Sheet,path').",
     )
     ap.add_argument("--prefix", default="Verse_", help="Filename prefix, default Verse_")
-    ap.add_argument("--bitrate", default="192k", help="Output bitrate for mp3, default 192k")
+    ap.add_argument(
+        "--bitrate",
+        default=None,
+        help=(
+            f"Output bitrate for mp3, default {DEFAULT_BITRATE}. When given, mp3 inputs at a "
+            "different bitrate are re-encoded instead of stream-copied."
+        ),
+    )
+    ap.add_argument(
+        "--vbr-quality",
+        "--vbr_quality",
+        dest="vbr_quality",
+        type=int,
+        choices=range(10),
+        metavar="0-9",
+        help="Encode VBR mp3 at this LAME quality instead of CBR (0 best, 9 smallest; 5 is ~130 kbps)",
+    )
     ap.add_argument("--fade_in", type=int, default=5, help="Fade in ms, default 5")
     ap.add_argument("--fade_out", type=int, default=10, help="Fade out ms, default 10")
     ap.add_argument("--zip", dest="make_zip", action="store_true", help="Also produce a ZIP of outputs")
+    ap.add_argument(
+        "--zip-compress",
+        "--zip_compress",
+        dest="zip_compress",
+        action="store_true",
+        help="Deflate files in the ZIP (default: store; mp3 barely compresses)",
+    )
     ap.add_argument("--csv", dest="csv_out", help="Write a timings CSV to this path")
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of verses to encode in parallel, default: number of CPUs",
+    )
+    ap.add_argument(
+        "--decode-once",
+        dest="decode_once",
+        action="store_true",
+        help="Decode each input once to a temporary PCM file and encode every verse from it (needs numpy)",
+    )
+    ap.add_argument(
+        "--single-pass",
+        dest="single_pass",
+        action="store_true",
+        help=(
+            "Cut the re-encoded verses of an input with one ffmpeg process per batch of up to "
+            f"{SINGLE_PASS_MAX_OUTPUTS} instead of one per verse; stream-copied verses are still cut "
+            "one per process (with --decode-once: one ffmpeg process, one encoder per verse)"
+        ),
+    )
     args = ap.parse_args()
 
+    if args.jobs < 1:
+        ap.error("--jobs must be at least 1.")
+
     if not args.input and not args.input_list:
         ap.error("Please provide either --input or --input-list.")
 
@@ -392,149 +1018,261 @@ def main():
     if args.input_list and not args.timestamps_excel:
         ap.error("--input-list currently requires --timestamps-excel.")
 
+    if args.bitrate is not None and args.vbr_quality is not None:
+        ap.error("Please provide only one of --bitrate or --vbr-quality, not both.")
+
+    if args.decode_once and not has_module("numpy"):
+        raise SystemExit("numpy is required for --decode-once. Install it with `pip install numpy`.")
+
+    for tool in ("ffmpeg", "ffprobe"):
+        if shutil.which(tool) is None:
+            raise SystemExit(f"{tool} not found on PATH. Install ffmpeg and try again.")
+
     os.makedirs(args.output, exist_ok=True)
 
-    audio: Optional[AudioSegment] = None
+    bitrate = args.bitrate or DEFAULT_BITRATE
     total_ms: Optional[int] = None
     if args.input:
-        audio = AudioSegment.from_file(args.input)
-        total_ms = len(audio)
+        total_ms = probe_duration_ms(args.input)
 
     export_paths: List[str] = []
-    csv_rows: List[Tuple] = []
-    csv_header: Optional[List[str]] = None
-
+    # export_futures[fpath] encodes fpath; pending holds each future once
+    export_futures: Dict[str, Future] = {}
+    pending: List[Future] = []
+    # (fpath, row) in output order, written to the CSV and ZIP as their verses finish
+    finished_rows: Deque[Tuple[str, Tuple]] = deque()
     if args.timestamps_excel:
-        chapters = load_timestamps_excel(args.timestamps_excel)
-        used_dirnames: Dict[str, int] = {}
-
-        if args.input_list:
-            try:
-                mapping, sequential = load_input_file_list(args.input_list)
-            except ValueError as exc:
-                raise SystemExit(str(exc)) from exc
-            sequential_iter = iter(sequential)
-            audio_cache: Dict[str, Tuple[AudioSegment, int]] = {}
-
-            def get_audio_for(sheet: str) -> Tuple[AudioSegment, int]:
-                explicit_path = mapping.get(sheet)
-                path = explicit_path if explicit_path is not None else next_from_iterator(sequential_iter)
-                if path is None:
-                    raise SystemExit(
-                        f"No audio file provided for sheet '{sheet}'. Update {args.input_list!r}."
-                    )
-                if path not in audio_cache:
-                    loaded = AudioSegment.from_file(path)
-                    audio_cache[path] = (loaded, len(loaded))
-                loaded_audio, duration_ms = audio_cache[path]
-                return loaded_audio, duration_ms
-
-        if audio is None and not args.input_list:
-            raise SystemExit("Internal error: audio not loaded.")
-
-        for sheet_name, segments in chapters.items():
-            base_dirname = sanitize_filename(sheet_name, "chapter")
-            count = used_dirnames.get(base_dirname, 0)
-            if count:
-                dirname = f"{base_dirname}_{count+1}"
-            else:
-                dirname = base_dirname
-            used_dirnames[base_dirname] = count + 1
-
-            sheet_dir = os.path.join(args.output, dirname)
-            os.makedirs(sheet_dir, exist_ok=True)
+        csv_header = ["Chapter", "Verse", "Start", "End", "Duration(s)", "File"]
+    else:
+        csv_header = ["Verse", "Start", "End", "Duration(s)", "File"]
 
-            if args.input_list:
-                sheet_audio, sheet_total_ms = get_audio_for(sheet_name)
+    with contextlib.ExitStack() as stack:
+        scratch_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="split_verses_"))
+        executor = stack.enter_context(ProcessPoolExecutor(max_workers=args.jobs))
+
+        def track(future: Future, fpaths: Iterable[str]) -> None:
+            pending.append(future)
+            for fpath in fpaths:
+                export_futures[fpath] = future
+
+        # cuts queued per input (--single-pass, or --decode-once which first needs the
+        # span they cover), submitted once every branch has run
+        batches: Dict[str, List[Tuple[int, int, str]]] = {}
+
+        def emit_cut(input_path: str, st: int, en: int, fpath: str) -> float:
+            """Queue ``[st, en)`` of ``input_path`` for export to ``fpath``; return its length in seconds.
+
+            Every mode funnels its cuts through here, so the export strategy
+            (per-verse ffmpeg, single pass, decoded PCM) is chosen in one place.
+            """
+            copy = args.vbr_quality is None and can_stream_copy(input_path, args.fade_in, args.fade_out, args.bitrate)
+            # stream copies need no decode, so they are always cut one verse per process
+            if (args.single_pass or args.decode_once) and not copy:
+                batches.setdefault(input_path, []).append((st, en, fpath))
             else:
-                assert audio is not None and total_ms is not None
-                sheet_audio, sheet_total_ms = audio, total_ms
-
-            for idx, seg in enumerate(segments, start=1):
-                st, en = clamp_segment(seg.start_ms, seg.end_ms, sheet_total_ms)
-                if en <= st:
-                    continue
-
-                fallback_name = f"{args.prefix}{idx:02d}"
-                base_fname = sanitize_filename(seg.label, fallback_name)
-                fname = f"{base_fname}.mp3"
-                fpath = os.path.join(sheet_dir, fname)
-                suffix = 2
-                while os.path.exists(fpath):
-                    fname = f"{base_fname}_{suffix}.mp3"
-                    fpath = os.path.join(sheet_dir, fname)
-                    suffix += 1
-
-                seg_audio = sheet_audio[st:en].fade_in(args.fade_in).fade_out(args.fade_out)
-                seg_audio.export(fpath, format="mp3", bitrate=args.bitrate)
-                export_paths.append(fpath)
-
-                duration = round((en - st) / 1000, 3)
-                csv_rows.append(
-                    (
-                        sheet_name,
-                        seg.label,
-                        mmss(st),
-                        mmss(en),
-                        duration,
-                        os.path.relpath(fpath, args.output),
-                    )
+                track(
+                    executor.submit(
+                        export_cut,
+                        input_path,
+                        st,
+                        en,
+                        fpath,
+                        args.fade_in,
+                        args.fade_out,
+                        bitrate,
+                        copy,
+                        args.vbr_quality,
+                    ),
+                    [fpath],
                 )
+            export_paths.append(fpath)
+            return round((en - st) / 1000, 3)
 
-        csv_header = ["Chapter", "Verse", "Start", "End", "Duration(s)", "File"]
+        if args.timestamps_excel:
+            chapters = load_timestamps_excel(args.timestamps_excel)
+            used_dirnames: Dict[str, int] = {}
+            # file names taken per output directory: existing files plus everything queued
+            used_fnames: Dict[str, Set[str]] = {}
 
-    elif args.timestamps:
-        if audio is None or total_ms is None:
-            raise SystemExit("--timestamps requires --input.")
-        cuts = load_timestamps_csv(args.timestamps, total_ms)
-        if not cuts:
-            raise SystemExit("No valid cuts parsed from timestamps CSV.")
-        for idx, (st, en) in enumerate(cuts, start=1):
-            seg = audio[st:en].fade_in(args.fade_in).fade_out(args.fade_out)
-            fname = f"{args.prefix}{idx:02d}.mp3"
-            fpath = os.path.join(args.output, fname)
-            seg.export(fpath, format="mp3", bitrate=args.bitrate)
-            export_paths.append(fpath)
-            csv_rows.append((idx, mmss(st), mmss(en), round(len(seg)/1000, 3), fname))
+            if args.input_list:
+                try:
+                    mapping, sequential = load_input_file_list(args.input_list)
+                except ValueError as exc:
+                    raise SystemExit(str(exc)) from exc
+                sequential_iter = iter(sequential)
+                duration_cache: Dict[str, int] = {}
+
+                def get_audio_for(sheet: str) -> Tuple[str, int]:
+                    explicit_path = mapping.get(sheet)
+                    path = explicit_path if explicit_path is not None else next_from_iterator(sequential_iter)
+                    if path is None:
+                        raise SystemExit(
+                            f"No audio file provided for sheet '{sheet}'. Update {args.input_list!r}."
+                        )
+                    if path not in duration_cache:
+                        duration_cache[path] = probe_duration_ms(path)
+                    return path, duration_cache[path]
+
+            if total_ms is None and not args.input_list:
+                raise SystemExit("Internal error: audio not loaded.")
+
+            for sheet_name, segments in chapters.items():
+                base_dirname = sanitize_filename(sheet_name, "chapter")
+                count = used_dirnames.get(base_dirname, 0)
+                if count:
+                    dirname = f"{base_dirname}_{count+1}"
+                else:
+                    dirname = base_dirname
+                used_dirnames[base_dirname] = count + 1
 
-        csv_header = ["Verse", "Start", "End", "Duration(s)", "File"]
+                sheet_dir = os.path.join(args.output, dirname)
+                os.makedirs(sheet_dir, exist_ok=True)
+                if sheet_dir not in used_fnames:
+                    used_fnames[sheet_dir] = set(os.listdir(sheet_dir))
+                used = used_fnames[sheet_dir]
 
-    else:
-        if audio is None or total_ms is None:
-            raise SystemExit("Grid mode requires --input.")
-        start_ms = parse_time(args.start)
-        length_ms = parse_time(args.length)
-        cuts = grid_cuts(start_ms, args.count, length_ms, total_ms)
-        if not cuts:
-            raise SystemExit("No valid cuts produced by grid. Check --start/--count/--length.")
-        for idx, (st, en) in enumerate(cuts, start=1):
-            seg = audio[st:en].fade_in(args.fade_in).fade_out(args.fade_out)
-            fname = f"{args.prefix}{idx:02d}.mp3"
-            fpath = os.path.join(args.output, fname)
-            seg.export(fpath, format="mp3", bitrate=args.bitrate)
-            export_paths.append(fpath)
-            csv_rows.append((idx, mmss(st), mmss(en), round(len(seg)/1000, 3), fname))
+                if args.input_list:
+                    sheet_input, sheet_total_ms = get_audio_for(sheet_name)
+                else:
+                    assert args.input is not None and total_ms is not None
+                    sheet_input, sheet_total_ms = args.input, total_ms
+
+                for idx, seg in enumerate(segments, start=1):
+                    st, en = clamp_segment(seg.start_ms, seg.end_ms, sheet_total_ms)
+                    if en <= st:
+                        continue
+
+                    fallback_name = f"{args.prefix}{idx:02d}"
+                    base_fname = sanitize_filename(seg.label, fallback_name)
+                    fname = f"{base_fname}.mp3"
+                    suffix = 2
+                    while fname in used:
+                        fname = f"{base_fname}_{suffix}.mp3"
+                        suffix += 1
+                    used.add(fname)
+                    fpath = os.path.join(sheet_dir, fname)
 
-        csv_header = ["Verse", "Start", "End", "Duration(s)", "File"]
+                    duration = emit_cut(sheet_input, st, en, fpath)
+                    row = (sheet_name, seg.label, mmss(st), mmss(en), duration, os.path.relpath(fpath, args.output))
+                    finished_rows.append((fpath, row))
+
+        elif args.timestamps:
+            if total_ms is None:
+                raise SystemExit("--timestamps requires --input.")
+            cuts = load_timestamps_csv(args.timestamps, total_ms)
+            if not cuts:
+                raise SystemExit("No valid cuts parsed from timestamps CSV.")
+            for idx, (st, en) in enumerate(cuts, start=1):
+                fname = f"{args.prefix}{idx:02d}.mp3"
+                fpath = os.path.join(args.output, fname)
+                duration = emit_cut(args.input, st, en, fpath)
+                finished_rows.append((fpath, (idx, mmss(st), mmss(en), duration, fname)))
 
-    if args.csv_out:
-        with open(args.csv_out, "w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            if csv_header:
-                w.writerow(csv_header)
-            for r in csv_rows:
-                w.writerow(r)
+        else:
+            if total_ms is None:
+                raise SystemExit("Grid mode requires --input.")
+            start_ms = parse_time(args.start)
+            length_ms = parse_time(args.length)
+            cuts = grid_cuts(start_ms, args.count, length_ms, total_ms)
+            if not cuts:
+                raise SystemExit("No valid cuts produced by grid. Check --start/--count/--length.")
+            for idx, (st, en) in enumerate(cuts, start=1):
+                fname = f"{args.prefix}{idx:02d}.mp3"
+                fpath = os.path.join(args.output, fname)
+                duration = emit_cut(args.input, st, en, fpath)
+                finished_rows.append((fpath, (idx, mmss(st), mmss(en), duration, fname)))
+
+        for input_path, batch in batches.items():
+            if args.decode_once:
+                # decode only the stretch of the input the cuts cover
+                source = decode_to_pcm(
+                    input_path,
+                    scratch_dir,
+                    min(st for st, _, _ in batch),
+                    max(en for _, en, _ in batch),
+                )
+                if args.single_pass:
+                    track(
+                        executor.submit(
+                            export_cuts_pcm_single_pass,
+                            source,
+                            batch,
+                            args.fade_in,
+                            args.fade_out,
+                            bitrate,
+                            args.vbr_quality,
+                        ),
+                        [fpath for _, _, fpath in batch],
+                    )
+                else:
+                    for st, en, fpath in batch:
+                        track(
+                            executor.submit(
+                                export_cut_pcm,
+                                source,
+                                st,
+                                en,
+                                fpath,
+                                args.fade_in,
+                                args.fade_out,
+                                bitrate,
+                                args.vbr_quality,
+                            ),
+                            [fpath],
+                        )
+            else:
+                track(
+                    executor.submit(
+                        export_cuts_single_pass,
+                        input_path,
+                        batch,
+                        args.fade_in,
+                        args.fade_out,
+                        bitrate,
+                        args.vbr_quality,
+                    ),
+                    [fpath for _, _, fpath in batch],
+                )
 
-    if args.make_zip:
+        # the CSV and ZIP are opened only once every cut has been planned, so a run
+        # that fails validation leaves the previous run's files alone
+        csv_writer = None
+        if args.csv_out:
+            csv_file = stack.enter_context(
+                open(args.csv_out, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFSIZE)
+            )
+            csv_writer = csv.writer(csv_file)
+            csv_writer.writerow(csv_header)
         zip_path = os.path.join(args.output, "verses.zip")
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for p in export_paths:
-                arcname = os.path.relpath(p, args.output)
-                zf.write(p, arcname=arcname)
+        zf = open_zip(stack, zip_path, args.zip_compress) if args.make_zip else None
+
+        def write_finished_rows() -> None:
+            """Write the leading verses that have been exported successfully to the CSV and ZIP."""
+            while finished_rows:
+                future = export_futures[finished_rows[0][0]]
+                if not future.done() or future.cancelled() or future.exception() is not None:
+                    return
+                fpath, row = finished_rows.popleft()
+                if csv_writer is not None:
+                    csv_writer.writerow(row)
+                if zf is not None:
+                    # written while the mp3 is still in the page cache, overlapping the encodes
+                    zf.write(fpath, arcname=os.path.relpath(fpath, args.output))
+
+        # exports finish in any order, but write_finished_rows only drains the front of
+        # finished_rows, so the CSV and ZIP stay in output order. Surface worker errors
+        # as they happen; on the first one, drop the verses still queued instead of
+        # encoding them for nothing
+        for future in as_completed(pending):
+            if future.exception() is not None:
+                for queued in pending:
+                    queued.cancel()
+                future.result()
+            write_finished_rows()
 
     print(f"Done. Wrote {len(export_paths)} files to: {args.output}")
     if args.make_zip:
-        print(f"ZIP: {os.path.join(args.output, 'verses.zip')}")
+        print(f"ZIP: {zip_path}")
     if args.csv_out:
         print(f"CSV: {args.csv_out}")
 